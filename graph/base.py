@@ -1,16 +1,15 @@
 import enum
 import json
 import warnings
+import weakref
 from typing import Any, Union
-from uuid import UUID, uuid4
+from uuid import uuid4
 
-from pydantic import BaseModel, Field
 
-
-class Direction(enum.Enum):
-    LEFT = enum.auto()
-    RIGHT = enum.auto()
-    NONE = enum.auto()
+class Direction(enum.IntEnum):
+    LEFT = 0
+    RIGHT = 1
+    NONE = 2
 
 
 class GraphError(Exception):
@@ -21,60 +20,266 @@ class GraphWarning(Warning):
     pass
 
 
-class Hashable(BaseModel):
-    id: UUID = Field(default_factory=uuid4)
+class Hashable:
+    __slots__ = ("id",)
+
+    def __init__(self, **data) -> None:
+        id = data.pop("id", None)
+        self.id = uuid4().int if id is None else id
+        for name, value in data.items():
+            setattr(self, name, value)
 
     def __hash__(self) -> int:
         return hash(self.id)
 
-def restrict_member_class_init(cls):
-    cls._gate_keeper = None
-    
-    class MemberClass(Hashable):
-        def __init__(self, **data) -> None:
-            if cls._gate_keeper is None:
-                raise GraphError(f"An object of type '{type(self).__name__}' \
-can obly be created through an instance of '{cls.__name__}'.")
-            super().__init__(**data)
-
-    setattr(cls, "MemberClass", MemberClass) 
-    return cls
-
-@restrict_member_class_init
-class Graph(BaseModel):
-    vertices: set["Vertex"] = set()
-    edges: set["Edge"] = set()
+    @classmethod
+    def from_dict(cls, data: dict) -> "Hashable":
+        return cls(**data)
+
+
+def _weight_key(weight: Any) -> int:
+    # unhashable weights fall back to identity: two edges carrying
+    # distinct dict/list weights are distinct edges
+    try:
+        return hash(weight)
+    except TypeError:
+        return id(weight)
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise GraphError("numpy is required for bulk edge operations")
+    return numpy
+
+
+def _preallocated_dict(size: int) -> dict:
+    # CPython dicts expose no reserve(); dict.fromkeys sizes the table in
+    # C, and deleting the sentinel keys leaves the table at that size
+    # class until the next resize.
+    d = dict.fromkeys(range(size))
+    for i in range(size):
+        del d[i]
+    return d
+
+
+class CompactGraph:
+    __slots__ = ("indptr", "indices", "weights")
+
+    def __init__(self, indptr, indices, weights) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    def neighbors(self, vertex_id: int):
+        return self.indices[self.indptr[vertex_id] : self.indptr[vertex_id + 1]]
+
+
+class Graph:
+    __slots__ = (
+        "__weakref__",
+        "vertices",
+        "edges",
+        "_adj",
+        "_next_id",
+        "_dup_edges",
+        "_src",
+        "_dst",
+        "_w",
+    )
+
+    def __init__(self, initial_node_count: int = 0, initial_edge_count: int = 0) -> None:
+        self.vertices = _preallocated_dict(initial_node_count)
+        self.edges = _preallocated_dict(initial_edge_count)
+        self._adj = dict.fromkeys(range(initial_node_count)) if initial_node_count else {}
+        self._next_id = 0
+        self._dup_edges = 0
+        self._src = None
+        self._dst = None
+        self._w = None
 
     def create_vertex(self, data) -> "Vertex":
-        Graph._gate_keeper = self
-        vertex = Vertex(value=data, graph=self)
-        Graph._gate_keeper = None
-        self.vertices.add(vertex)
+        vertex = Vertex._construct(self, data, self._next_id)
+        self._next_id += 1
+        self.vertices[vertex] = None
+        self._adj[vertex.id] = {}
         return vertex
 
-
-@restrict_member_class_init
-class Vertex(Graph.MemberClass):
-    value: Any = None
-    graph: Graph = None
+    def create_vertices(self, values) -> list["Vertex"]:
+        next_id = self._next_id
+        vertices = []
+        for value in values:
+            vertices.append(Vertex._construct(self, value, next_id))
+            next_id += 1
+        self._next_id = next_id
+        # one C-level update over a generator instead of a Python-level
+        # loop of single-key inserts
+        self.vertices.update((vertex, None) for vertex in vertices)
+        self._adj.update((vertex.id, {}) for vertex in vertices)
+        return vertices
+
+    def freeze(self) -> "Graph":
+        # read-only view for algorithms doing repeated membership and
+        # set-algebra queries: frozensets take CPython's optimized
+        # set-operation paths and cannot be mutated accidentally
+        frozen = object.__new__(Graph)
+        frozen.vertices = frozenset(self.vertices)
+        frozen.edges = frozenset(self.edges)
+        # snapshot the adjacency index too, so the view stays consistent
+        # with the frozen containers as the live graph keeps growing
+        frozen._adj = {
+            vertex_id: dict(neighbors) if neighbors is not None else None
+            for vertex_id, neighbors in self._adj.items()
+        }
+        frozen._next_id = self._next_id
+        frozen._dup_edges = self._dup_edges
+        frozen._src = self._src
+        frozen._dst = self._dst
+        frozen._w = self._w
+        return frozen
+
+    def check_duplicates(self) -> int:
+        if self._dup_edges:
+            warnings.warn(
+                f"{self._dup_edges} duplicate edge(s) ignored", GraphWarning
+            )
+        return self._dup_edges
+
+    def _register_edge(self, edge: "Edge") -> None:
+        if edge.direction != Direction.LEFT:
+            self._adj.setdefault(edge.vertex1.id, {})[edge.vertex2.id] = edge
+        if edge.direction != Direction.RIGHT:
+            self._adj.setdefault(edge.vertex2.id, {})[edge.vertex1.id] = edge
+
+    def _unregister_edge(self, edge: "Edge") -> None:
+        # parallel edges may have overwritten the slot, so only drop the
+        # entry if it is this very edge
+        if edge.direction != Direction.LEFT:
+            neighbors = self._adj.get(edge.vertex1.id)
+            if neighbors and neighbors.get(edge.vertex2.id) is edge:
+                del neighbors[edge.vertex2.id]
+        if edge.direction != Direction.RIGHT:
+            neighbors = self._adj.get(edge.vertex2.id)
+            if neighbors and neighbors.get(edge.vertex1.id) is edge:
+                del neighbors[edge.vertex1.id]
+
+    def neighbors(self, vertex: "Vertex") -> list["Vertex"]:
+        return [
+            edge.vertex2 if edge.vertex1 is vertex else edge.vertex1
+            for edge in self._adj.get(vertex.id, {}).values()
+        ]
+
+    def add_edges_from(self, src, dst, weight=None) -> None:
+        np = _require_numpy()
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if src.shape != dst.shape:
+            raise GraphError("src and dst must have the same length")
+        if weight is None:
+            weight = np.zeros(src.shape[0], dtype=np.float64)
+        else:
+            weight = np.asarray(weight, dtype=np.float64)
+        if self._src is None:
+            self._src, self._dst, self._w = src, dst, weight
+        else:
+            self._src = np.concatenate([self._src, src])
+            self._dst = np.concatenate([self._dst, dst])
+            self._w = np.concatenate([self._w, weight])
+
+    def to_csr(self):
+        np = _require_numpy()
+        if self._src is None:
+            return (
+                np.zeros(self._next_id + 1, dtype=np.int64),
+                np.empty(0, dtype=np.int64),
+            )
+        order = np.argsort(self._src, kind="stable")
+        indices = self._dst[order]
+        counts = np.bincount(self._src, minlength=self._next_id)
+        indptr = np.concatenate([np.zeros(1, dtype=np.int64), counts.cumsum()])
+        return indptr, indices
+
+    def compact(self) -> "CompactGraph":
+        np = _require_numpy()
+        # emit one row per direction an edge points, mirroring
+        # _register_edge: swap endpoints for LEFT, both rows for NONE
+        src_rows, dst_rows, weight_rows = [], [], []
+        for edge in self.edges:
+            weight = (
+                float(edge.weight) if isinstance(edge.weight, (int, float)) else 0.0
+            )
+            if edge.direction != Direction.LEFT:
+                src_rows.append(edge.vertex1.id)
+                dst_rows.append(edge.vertex2.id)
+                weight_rows.append(weight)
+            if edge.direction != Direction.RIGHT:
+                src_rows.append(edge.vertex2.id)
+                dst_rows.append(edge.vertex1.id)
+                weight_rows.append(weight)
+        src = np.asarray(src_rows, dtype=np.int64)
+        dst = np.asarray(dst_rows, dtype=np.int64)
+        weights = np.asarray(weight_rows, dtype=np.float64)
+        if self._src is not None:
+            src = np.concatenate([src, self._src])
+            dst = np.concatenate([dst, self._dst])
+            weights = np.concatenate([weights, self._w])
+        order = np.argsort(src, kind="stable")
+        counts = np.bincount(src, minlength=self._next_id)
+        indptr = np.concatenate([np.zeros(1, dtype=np.int64), counts.cumsum()])
+        return CompactGraph(indptr, dst[order], weights[order])
+
+
+class Vertex(Hashable):
+    __slots__ = ("value", "_graph", "_str")
+
+    def __init__(self, **data) -> None:
+        graph = data.pop("graph", None)
+        if graph is None:
+            raise GraphError(f"An object of type '{type(self).__name__}' \
+can only be created through an instance of '{Graph.__name__}'.")
+        if "id" in data:
+            raise GraphError("Vertex ids are allocated by the graph.")
+        self.value = None
+        # weakref: vertices are only reachable through their graph, so a
+        # strong back-reference would just create V reference cycles
+        self._graph = weakref.ref(graph)
+        self._str = None
+        super().__init__(id=graph._next_id, **data)
+        graph._next_id += 1
+        graph.vertices[self] = None
+        graph._adj[self.id] = {}
+
+    @property
+    def graph(self) -> Graph:
+        return self._graph()
+
+    @classmethod
+    def _construct(cls, graph: Graph, value: Any, id: int) -> "Vertex":
+        # trusted construction for graph-internal call sites: skips the
+        # kwargs dispatch and gate check of __init__
+        vertex = object.__new__(cls)
+        vertex.id = id
+        vertex.value = value
+        vertex._graph = weakref.ref(graph)
+        vertex._str = None
+        return vertex
 
     def save_relationship(func) -> None:
         def wrapper(self, vertex: "Vertex", *args, **kwargs):
             edge = func(self, vertex, *args, **kwargs)
-            # for some reason the hash is not working...
-            if hash(edge) in [hash(e) for e in self.graph.edges]:
-                warnings.warn(f"Edge '{edge}' already exists", GraphWarning)
+            if edge in self.graph.edges:
+                self.graph._dup_edges += 1
             else:
-                self.graph.edges.add(edge)
+                self.graph.edges[edge] = None
+                self.graph._register_edge(edge)
+                edge._registered = True
             return edge
 
         return wrapper
 
     def _create_edge(self, vertex: "Vertex", weight: Any = None) -> "Edge":
-        Vertex._gate_keeper = self
-        edge = Edge(weight=weight, vertex1=self, vertex2=vertex, _graph=self.graph)
-        Vertex._gate_keeper = None
-        return edge
+        return Edge._construct(self, vertex, weight)
 
     @save_relationship
     def edge(self, vertex: "Vertex", weight: Any = None) -> "Edge":
@@ -102,29 +307,120 @@ class Vertex(Graph.MemberClass):
         return self.edge(other)
 
     def __str__(self) -> str:
-        try:
-            val = json.dumps(self.value)
-        except TypeError:
-            val = str(self.value)
-        return f"(value: {val})"
+        if self._str is None:
+            try:
+                val = json.dumps(self.value)
+            except TypeError:
+                val = str(self.value)
+            self._str = f"(value: {val})"
+        return self._str
 
     __repr__ = __str__
 
 
-class Edge(Vertex.MemberClass):
-    vertex1: Vertex = None
-    vertex2: Vertex = None
-    direction: Direction = Direction.NONE
-    weight: Any = None
+# not a Hashable: edges key on their endpoints/direction/weight, so an
+# allocated id would never be read
+class Edge:
+    __slots__ = (
+        "vertex1",
+        "vertex2",
+        "direction",
+        "weight",
+        "_h",
+        "_str",
+        "_wkey",
+        "_registered",
+    )
+
+    def __init__(self, **data) -> None:
+        if data.get("vertex1") is None or data.get("vertex2") is None:
+            raise GraphError(f"An object of type '{type(self).__name__}' \
+can only be created through an instance of '{Vertex.__name__}'.")
+        self.vertex1 = None
+        self.vertex2 = None
+        self.direction = Direction.NONE
+        self.weight = None
+        self._h = None
+        self._str = None
+        self._registered = False
+        _graph = data.pop("_graph", None)
+        for name, value in data.items():
+            setattr(self, name, value)
+        self._wkey = _weight_key(self.weight)
+        if _graph is None:
+            return
+        # the common case — both endpoints in _graph — reduces to comparing
+        # the cached weakrefs, no dereference; identity, not ==: Graph
+        # equality would otherwise compare every vertex and edge per edge
+        if self.vertex1._graph is self.vertex2._graph is _graph.__weakref__:
+            return
+        if self.vertex1.graph is not _graph or self.vertex2.graph is not _graph:
+            raise GraphError("Cannot create an edge between vertices \
+from different graphs.")
+
+    @classmethod
+    def _construct(cls, vertex1: "Vertex", vertex2: "Vertex", weight: Any = None) -> "Edge":
+        if vertex1._graph is not vertex2._graph and vertex1.graph is not vertex2.graph:
+            raise GraphError("Cannot create an edge between vertices \
+from different graphs.")
+        edge = object.__new__(cls)
+        edge.vertex1 = vertex1
+        edge.vertex2 = vertex2
+        edge.direction = Direction.NONE
+        edge.weight = weight
+        edge._h = None
+        edge._str = None
+        edge._wkey = _weight_key(weight)
+        edge._registered = False
+        return edge
 
-    def _get_unique_id(self) -> str:
-        return f"{hash(self.vertex1)}{hash(self.vertex2)}{self.direction}{self.weight}"
+    def _key(self) -> tuple:
+        # hashing only — _wkey may collide, so equality compares the real
+        # weights below
+        return (self.vertex1.id, self.vertex2.id, self.direction.value, self._wkey)
 
     def __hash__(self) -> int:
-        return hash(self._get_unique_id())
+        if self._h is None:
+            self._h = hash(self._key())
+        return self._h
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Edge):
+            return NotImplemented
+        if (
+            self.vertex1.id != other.vertex1.id
+            or self.vertex2.id != other.vertex2.id
+            or self.direction != other.direction
+        ):
+            return False
+        # unhashable weights fall back to identity, consistent with _wkey
+        if self.weight.__hash__ is None or other.weight.__hash__ is None:
+            return self.weight is other.weight
+        return self.weight == other.weight
 
     def __call__(self, weight: Any) -> "Edge":
+        # changing the weight changes the edge's key, so a registered edge
+        # must be pulled out of its graph's containers, rehashed and
+        # reinserted — otherwise it stays filed under its stale hash
+        graph = self.vertex1.graph if self._registered else None
+        if graph is not None:
+            del graph.edges[self]
+            graph._unregister_edge(self)
         self.weight = weight
+        self._wkey = _weight_key(weight)
+        self._h = None
+        self._str = None
+        if graph is not None:
+            if self in graph.edges:
+                self._registered = False
+                graph._dup_edges += 1
+                # this edge's registration may have clobbered the surviving
+                # equal edge's adjacency slot; restore it (cold path)
+                stored = next(e for e in graph.edges if e == self)
+                graph._register_edge(stored)
+            else:
+                graph.edges[self] = None
+                graph._register_edge(self)
         return self
 
     def edge(self, other: Union[Vertex, "Edge"], weight: Any = None) -> "Edge":
@@ -141,7 +437,7 @@ class Edge(Vertex.MemberClass):
         if isinstance(other, Vertex):
             return self.vertex2.rledge(other, weight)
         return self.vertex2.redge(other.vertex1, weight)
-    
+
     def __lt__(self, other: Union[Vertex, "Edge"]) -> "Edge":
         return self.ledge(other)
 
@@ -152,6 +448,8 @@ class Edge(Vertex.MemberClass):
         return self.edge(other)
 
     def __str__(self) -> str:
+        if self._str is not None:
+            return self._str
         if self.weight is None:
             rel_weight = ""
         else:
@@ -165,6 +463,7 @@ class Edge(Vertex.MemberClass):
             rel_str = "<" + rel_str
         elif self.direction == Direction.RIGHT:
             rel_str = rel_str + ">"
-        return f"{self.vertex1} {rel_str} {self.vertex2}"
+        self._str = f"{self.vertex1} {rel_str} {self.vertex2}"
+        return self._str
 
     __repr__ = __str__
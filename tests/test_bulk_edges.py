@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from graph.base import Graph
+
+def test_add_edges_from_to_csr():
+    g = Graph()
+    for i in range(4):
+        g.create_vertex(i)
+
+    g.add_edges_from([0, 0, 2], [1, 3, 1])
+    g.add_edges_from([1], [2], weight=[0.5])
+
+    indptr, indices = g.to_csr()
+    assert indptr.tolist() == [0, 2, 3, 4, 4]
+    assert indices[indptr[0]:indptr[1]].tolist() == [1, 3]
+    assert indices[indptr[2]:indptr[3]].tolist() == [1]
+
+def test_to_csr_without_bulk_edges():
+    g = Graph()
+    g.create_vertex(0)
+    g.create_vertex(1)
+
+    indptr, indices = g.to_csr()
+    assert indptr.tolist() == [0, 0, 0]
+    assert indices[indptr[0]:indptr[1]].tolist() == []
+    assert indices[indptr[1]:indptr[2]].tolist() == []
+
+def test_compact():
+    g = Graph()
+    t0 = g.create_vertex(0)
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    (t0 > t1)(2)
+    t0 > t2
+
+    compact = g.compact()
+    assert sorted(compact.neighbors(0).tolist()) == [1, 2]
+    assert compact.neighbors(1).tolist() == []
+    assert compact.weights.tolist() == [2.0, 0.0]
+
+def test_compact_directions():
+    g = Graph()
+    t0 = g.create_vertex(0)
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    t0 < t1
+    t0 - t2
+
+    compact = g.compact()
+    assert compact.neighbors(0).tolist() == [2]
+    assert compact.neighbors(1).tolist() == [0]
+    assert compact.neighbors(2).tolist() == [0]
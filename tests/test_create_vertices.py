@@ -0,0 +1,15 @@
+from graph.base import Graph
+
+def test_create_vertices():
+    g = Graph()
+    t0 = g.create_vertex(0)
+    vertices = g.create_vertices(["a", "b", "c"])
+
+    assert [v.value for v in vertices] == ["a", "b", "c"]
+    assert [v.id for v in vertices] == [1, 2, 3]
+    for v in vertices:
+        assert v in g.vertices
+        assert v.id in g._adj
+
+    t0 > vertices[0]
+    assert g.neighbors(t0) == [vertices[0]]
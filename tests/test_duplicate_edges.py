@@ -0,0 +1,61 @@
+import pytest
+
+from graph.base import Graph, GraphWarning
+
+def test_duplicate_edge_detected():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    t1 > t2
+    t1 > t2
+    assert len(g.edges) == 1
+    with pytest.warns(GraphWarning):
+        assert g.check_duplicates() == 1
+
+def test_distinct_edges_not_duplicates():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    t1 > t2
+    t1 < t2
+    t1 - t2
+    assert len(g.edges) == 3
+    assert g.check_duplicates() == 0
+
+def test_weight_call_rekeys_registered_edge():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    e1 = (t1 > t2)(5)
+    e2 = t1.redge(t2, 5)
+    assert e1 == e2
+    assert hash(e1) == hash(e2)
+    assert len(g.edges) == 1
+    with pytest.warns(GraphWarning):
+        assert g.check_duplicates() == 1
+
+def test_weight_call_duplicate_detected():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    (t1 > t2)(5)
+    (t1 > t2)(5)
+    assert len(g.edges) == 1
+    assert g.neighbors(t1) == [t2]
+    with pytest.warns(GraphWarning):
+        assert g.check_duplicates() == 1
+
+def test_colliding_weight_hashes_not_duplicates():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+
+    # hash(-1) == hash(-2) in CPython
+    t1.edge(t2, -1)
+    t1.edge(t2, -2)
+    assert len(g.edges) == 2
+    assert g.check_duplicates() == 0
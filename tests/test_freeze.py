@@ -0,0 +1,34 @@
+import pytest
+
+from graph.base import Graph
+
+def test_freeze_membership_and_immutability():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+    t3 = g.create_vertex(3)
+
+    e = t1 > t2
+    f = g.freeze()
+
+    assert t1 in f.vertices and t3 in f.vertices
+    assert e in f.edges
+    assert f.vertices & {t1, t2} == {t1, t2}
+    with pytest.raises(TypeError):
+        f.vertices[t3] = None
+    with pytest.raises(TypeError):
+        f.edges[e] = None
+
+def test_freeze_is_a_snapshot():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+    t3 = g.create_vertex(3)
+
+    t1 > t2
+    f = g.freeze()
+    t1 - t3
+
+    assert len(f.edges) == 1
+    assert set(f.neighbors(t1)) == {t2}
+    assert set(g.neighbors(t1)) == {t2, t3}
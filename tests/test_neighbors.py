@@ -0,0 +1,15 @@
+from graph.base import Graph
+
+def test_neighbors():
+    g = Graph()
+    t1 = g.create_vertex(1)
+    t2 = g.create_vertex(2)
+    t3 = g.create_vertex(3)
+
+    t1 > t2
+    t1 - t3
+    t3 > t2
+
+    assert set(g.neighbors(t1)) == {t2, t3}
+    assert set(g.neighbors(t2)) == set()
+    assert set(g.neighbors(t3)) == {t1, t2}